@@ -0,0 +1,86 @@
+import numpy as np
+from statsmodels.tsa.adfvalues import mackinnonp
+from statsmodels.tsa.stattools import adfuller
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def schwert_maxlag(nobs: int) -> int:
+    """Schwert's rule of thumb for the number of ADF lags, capped so the
+    regression keeps enough degrees of freedom (as in ``adfuller``)."""
+    maxlag = int(np.ceil(12.0 * (nobs / 100.0) ** 0.25))
+    maxlag = min(nobs // 2 - 2, maxlag)
+    if maxlag < 0:
+        raise ValueError('sample size is too short to use selected '
+                         'regression component')
+    return maxlag
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def adf_c(y, maxlag):
+        """ADF t-statistic for a constant-only regression with a fixed
+        number of lagged differences."""
+        dy = np.diff(y)
+        nobs = dy.shape[0] - maxlag
+        k = maxlag + 2
+
+        # Regressors: lagged level, lagged differences and the constant
+        X = np.empty((nobs, k))
+        for t in range(nobs):
+            X[t, 0] = y[maxlag + t]
+            for j in range(1, maxlag + 1):
+                X[t, j] = dy[maxlag + t - j]
+            X[t, k - 1] = 1.0
+        target = np.ascontiguousarray(dy[maxlag:])
+
+        # OLS through the (small) normal equations
+        XT = np.ascontiguousarray(X.T)
+        inv = np.linalg.inv(XT @ X)
+        beta = inv @ (XT @ target)
+        resid = target - X @ beta
+        sigma2 = (resid @ resid) / (nobs - k)
+
+        return beta[0] / np.sqrt(sigma2 * inv[0, 0])
+
+
+def adf_test(y: np.ndarray, maxlag: int | None = None) -> tuple[float, float]:
+    """Augmented Dickey-Fuller test with a constant and a fixed lag order.
+
+    Uses the Numba kernel when available and falls back to ``adfuller``
+    otherwise.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        Series to test, without missing values.
+    maxlag : int, optional
+        Number of lagged differences, by default given by Schwert's rule.
+
+    Returns
+    -------
+    tuple[float, float]
+        ADF statistic and MacKinnon approximate p-value.
+
+    Raises
+    ------
+    ValueError
+        If the series is too short for the regression or ``maxlag`` leaves
+        too few degrees of freedom.
+    """
+    if maxlag is None:
+        maxlag = schwert_maxlag(len(y))
+    elif maxlag < 0 or maxlag > len(y) // 2 - 2:
+        raise ValueError('maxlag must be between 0 and (nobs/2 - 2) for '
+                         'the constant-only regression')
+
+    if NUMBA_AVAILABLE:
+        stat = adf_c(np.asarray(y, dtype=np.float64), maxlag)
+        return stat, mackinnonp(stat, regression='c', N=1)
+
+    adf = adfuller(y, maxlag=maxlag, autolag=None, regression='c')
+    return adf[0], adf[1]
@@ -1,13 +1,32 @@
-
+import hashlib
+import os
+import time
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
 from datetime import datetime, timedelta
+from pathlib import Path
+
+
+CACHE_DIR = Path.home() / '.cache' / 'quantfin'
+CACHE_TTL = timedelta(days=1)
+
+
+def _cache_path(tickers: list[str], start: datetime, end: datetime) -> Path:
+    """Build the parquet cache file path for a download request."""
+    key = repr((sorted(tickers), start.date(), end.date())).encode()
+    key = hashlib.blake2b(key).hexdigest()[:16]
+    return CACHE_DIR / f'{key}.parquet'
 
 
 def stock_data(tickers: list[str], days=200) -> pd.DataFrame:
     """Download historical data for the specified tickers for a given period.
 
+    Downloads are cached as parquet files under ``~/.cache/quantfin/`` and
+    reused for one day, so repeated calls with the same tickers and period
+    do not hit the network. Downloads with failed tickers are not cached.
+
     Parameters
     ----------
     tickers : list[str]
@@ -19,17 +38,40 @@ def stock_data(tickers: list[str], days=200) -> pd.DataFrame:
     -------
     pd.DataFrame
         DataFrame with adjusted close and volume of each stock in the
-        specified period.
+        specified period. Prices are stored as ``float32``; upcast locally
+        (e.g. ADF tests, higher moments) when full precision is needed.
     """
     end = datetime.today()
     start = end - timedelta(days=days)
 
+    path = _cache_path(tickers, start, end)
+    if path.exists() and time.time() - path.stat().st_mtime < CACHE_TTL.total_seconds():
+        try:
+            return pd.read_parquet(path, engine='pyarrow')
+        except Exception as E:
+            print(f"Error al leer la caché: {E}")
+
     try:
-        data = yf.download(tickers, start=start, end=end)
+        data = yf.download(tickers, start=start, end=end,
+                           threads=True, progress=False)
         data.index.name = None
         data.columns.name = None
-        return data
+
+        # Single precision is enough for plotting and halves memory
+        num_cols = data.select_dtypes('float64').columns
+        data[num_cols] = data[num_cols].astype(np.float32)
     except Exception as E:
         print(f"Error al descargar datos: {E}")
         return None
 
+    # Failed tickers come back as all-NaN columns, only cache full downloads
+    if not data.empty and not data.isna().all().any():
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+            data.to_parquet(tmp, engine='pyarrow', compression='zstd')
+            os.replace(tmp, path)
+        except Exception as E:
+            print(f"Error al guardar la caché: {E}")
+
+    return data
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional, pandas' window functions are used without it
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+    prange = range
+
+
+@njit(cache=True, parallel=True)
+def _ma_ema(x, window, alpha):
+    """Moving average and exponential moving average of every column of
+    ``x`` in a single online pass."""
+    n_obs, n_cols = x.shape
+    out_ma = np.empty_like(x)
+    out_ema = np.empty_like(x)
+
+    for col in prange(n_cols):
+        # Running sum over the last `window` observations
+        s = 0.0
+        count = 0
+        # Exponential weighting, matching pandas' ewm(adjust=False)
+        weighted = x[0, col]
+        old_wt = 1.0
+        seen = weighted == weighted
+
+        for t in range(n_obs):
+            cur = x[t, col]
+            is_obs = cur == cur
+            if is_obs:
+                s += cur
+                count += 1
+            if t >= window:
+                old = x[t - window, col]
+                if old == old:
+                    s -= old
+                    count -= 1
+            out_ma[t, col] = s / window if count == window else np.nan
+
+            if t > 0:
+                seen = seen or is_obs
+                if weighted == weighted:
+                    old_wt *= 1.0 - alpha
+                    if is_obs:
+                        if weighted != cur:
+                            weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                        old_wt = 1.0
+                elif is_obs:
+                    weighted = cur
+            out_ema[t, col] = weighted if seen else np.nan
+
+    return out_ma, out_ema
+
+
+def ma_ema(data: pd.DataFrame, window: int = 20,
+           span: int = 100) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Calculate the simple and exponential moving averages of each stock.
+
+    Equivalent to ``data.rolling(window).mean()`` and
+    ``data.ewm(span=span, adjust=False).mean()``, computed together in one
+    pass by a Numba kernel when Numba is installed, and by pandas otherwise.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Each column is a stock's prices.
+    window : int, optional
+        Window of the simple moving average, by default 20.
+    span : int, optional
+        Span of the exponential moving average, by default 100.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, pd.DataFrame]
+        Simple and exponential moving averages, shaped like ``data``.
+    """
+    if not NUMBA_AVAILABLE:
+        return (data.rolling(window).mean(),
+                data.ewm(span=span, adjust=False).mean())
+
+    x = data.to_numpy(dtype=np.float64)
+    ma, ema = _ma_ema(x, window, 2.0 / (span + 1.0))
+
+    return (pd.DataFrame(ma, index=data.index, columns=data.columns),
+            pd.DataFrame(ema, index=data.index, columns=data.columns))
@@ -1,9 +1,14 @@
 
+import numpy as np
 import pandas as pd
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
-from statsmodels.tsa.seasonal import seasonal_decompose
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
 
+from analysis_tools import fft_decomposition, ma_decomposition
+
 
 def tracking_plot(data: pd.DataFrame, tickers: list[str],
                   title: str, xlabel: str, ylabel: str):
@@ -24,13 +29,13 @@ def tracking_plot(data: pd.DataFrame, tickers: list[str],
     """
     plt.figure(figsize=(9, 6))
 
-    for t in tickers:
-        plt.plot(data.index, data[t], label=t)
+    # One call draws a line per column
+    lines = plt.plot(data.index, data[tickers].to_numpy())
 
     plt.title(title)
     plt.xlabel(xlabel)
     plt.ylabel(ylabel)
-    plt.legend()
+    plt.legend(lines, tickers)
     plt.grid(True, color='k', linestyle=':')
     plt.tight_layout()
     plt.show()
@@ -53,9 +58,21 @@ def plot_histograms(data: pd.DataFrame, tickers: list[str]):
     _, axes = plt.subplots(rows, cols, figsize=(9, 6))
     axes = axes.flatten()
 
+    # Bin every ticker on the same edges so the x-axes are comparable
+    valid_tickers = [t for t in tickers if t in data.columns]
+    arr = data[valid_tickers].to_numpy(dtype=np.float64)
+    counts = {}
+    if np.isfinite(arr).any():
+        finite = arr[np.isfinite(arr)]
+        edges = np.linspace(finite.min(), finite.max(), 51)
+        for j, ticker in enumerate(valid_tickers):
+            col = arr[:, j]
+            counts[ticker], _ = np.histogram(col[np.isfinite(col)], bins=edges)
+
     for i, ticker in enumerate(tickers):
-        if ticker in data.columns:
-            axes[i].hist(data[ticker], alpha=0.7, color='blue', edgecolor='black')
+        if ticker in counts:
+            axes[i].bar(edges[:-1], counts[ticker], width=np.diff(edges),
+                        align='edge', alpha=0.7, color='blue', edgecolor='black')
             axes[i].set_title(f'{ticker} Returns', fontsize=12)
             axes[i].set_xlabel('Return')
             axes[i].set_ylabel('Frequency')
@@ -70,7 +87,8 @@ def plot_histograms(data: pd.DataFrame, tickers: list[str]):
 
 
 def plot_boxplots(data: pd.DataFrame, tickers: list[str]):
-    """Creates subplots with boxplots for each stock's returns.
+    """Creates a single plot with side-by-side boxplots of each stock's
+    returns.
 
     Parameters
     ----------
@@ -79,31 +97,22 @@ def plot_boxplots(data: pd.DataFrame, tickers: list[str]):
     tickers : list[str]
         A list of ticker symbols to plot.
     """
-    n = len(tickers)
-    rows = (n + 2) // 3
-    cols = 3
+    valid_tickers = [t for t in tickers if t in data.columns]
+    arr = data[valid_tickers].to_numpy(dtype=np.float64)
+    returns = [col[~np.isnan(col)] for col in arr.T]
 
-    _, axes = plt.subplots(rows, cols, figsize=(9, 6))
-    axes = axes.flatten()
-
-    for i, ticker in enumerate(tickers):
-        if ticker in data.columns:
-            axes[i].boxplot(data[ticker].dropna(), patch_artist=True, boxprops=dict(facecolor='lightblue'))
-            axes[i].set_title(f'{ticker} Returns', fontsize=12)
-            axes[i].set_ylabel('Return')
-            axes[i].set_xticks([])
-        else:
-            axes[i].axis('off')
-
-    # Turn off remaining unused subplots
-    for j in range(len(tickers), len(axes)):
-        axes[j].axis('off')
+    _, ax = plt.subplots(figsize=(9, 6))
+    ax.boxplot(returns, tick_labels=valid_tickers, patch_artist=True,
+               boxprops=dict(facecolor='lightblue'))
+    ax.set_title('Returns', fontsize=12)
+    ax.set_ylabel('Return')
 
     plt.tight_layout()
     plt.show()
 
 
-def ts_decomposition(data: pd.DataFrame, tickers: list[str]):
+def ts_decomposition(data: pd.DataFrame, tickers: list[str],
+                     method: str = 'moving_average', period: int = 30):
     """Perform seasonal decomposition for all tickers and plot
     the results.
 
@@ -113,26 +122,46 @@ def ts_decomposition(data: pd.DataFrame, tickers: list[str]):
         A DataFrame with dates as the index and tickers as columns.
     tickers : list[str]
         A list of ticker symbols to plot.
+    method : str, optional
+        ``'moving_average'`` for the classical additive decomposition or
+        ``'fft'`` to keep the strongest Fourier frequencies as seasonality,
+        faster on long histories. By default ``'moving_average'``.
+    period : int, optional
+        Seasonal period, by default 30.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is not supported or ``period`` is smaller than 2.
     """
+    if method not in ('moving_average', 'fft'):
+        raise ValueError(f"Unknown decomposition method: '{method}'.")
+    if not isinstance(period, int) or period < 2:
+        raise ValueError(f'period must be an integer of at least 2, got {period}.')
+
     n = len(tickers)
-    fig, axes = plt.subplots(n, 3, figsize=(17, 18))
+    fig, axes = plt.subplots(n, 3, figsize=(17, 18), sharex='col')
     fig.tight_layout(pad=5.0)
 
-    for i, ticker in enumerate(data.columns):
-        # Seasonal decomposition
-        decomposition = seasonal_decompose(data[ticker].dropna(),
-                                           model='additive', period=30)
+    # Seasonal decomposition of all tickers at once, column-wise
+    prices = data[tickers].dropna(how='any')
+    if method == 'fft':
+        components = fft_decomposition(prices, period=period)
+    else:
+        components = ma_decomposition(prices, period=period)
+    trend, seasonal, resid = (c.values for c in components)
 
+    for i, ticker in enumerate(tickers):
         # Plots
-        axes[i, 0].plot(decomposition.trend)
+        axes[i, 0].plot(prices.index, trend[:, i], rasterized=True)
         axes[i, 0].set_title(f'{ticker} - Trend')
         axes[i, 0].grid()
 
-        axes[i, 1].plot(decomposition.seasonal)
+        axes[i, 1].plot(prices.index, seasonal[:, i], rasterized=True)
         axes[i, 1].set_title(f'{ticker} - Seasonal')
         axes[i, 1].grid()
 
-        axes[i, 2].plot(decomposition.resid)
+        axes[i, 2].plot(prices.index, resid[:, i], rasterized=True)
         axes[i, 2].set_title(f'{ticker} - Residuals')
         axes[i, 2].grid()
 
@@ -152,16 +181,21 @@ def acf_pacf(data: pd.DataFrame, tickers: list[str]):
         A list of ticker symbols to plot.
     """
     n = len(tickers)
-    fig, axes = plt.subplots(n, 2, figsize=(17, 18))
+    fig, axes = plt.subplots(n, 2, figsize=(17, 18), sharex='col')
     fig.tight_layout(pad=5.0)
 
+    arr = data.to_numpy(dtype=np.float64)
+
     for i, ticker in enumerate(data.columns):
+        series = arr[:, i][~np.isnan(arr[:, i])]
+
         # Autocorrelation
-        plot_acf(data[ticker].dropna(), lags=25, ax=axes[i, 0])
+        plot_acf(series, lags=25, alpha=None, ax=axes[i, 0])
         axes[i, 0].set_title(f'{ticker} - Autocorrelation (ACF)')
 
         # Partial Autocorrelation
-        plot_pacf(data[ticker].dropna(), lags=25, ax=axes[i, 1])
+        plot_pacf(series, lags=25, method='ywm', alpha=None,
+                  ax=axes[i, 1])
         axes[i, 1].set_title(f'{ticker} - Partial Autocorrelation (PACF)')
 
     plt.suptitle('ACF and PACF for Stock Returns')
@@ -187,12 +221,33 @@ def moving_averages(data: pd.DataFrame, ma: pd.DataFrame, ema: pd.DataFrame):
     if n == 1:
         axes = [axes]
 
-    for i, ticker in enumerate(data.columns):
-        axes[i].plot(data.index, data[ticker], label=f'{ticker} - Prices', color='blue', linewidth=0.7)
-        axes[i].plot(ma.index, ma[ticker], label=f'{ticker} - MA', color='orange', linestyle='--')
-        axes[i].plot(ema.index, ema[ticker], label=f'{ticker} - EMA', color='green', linestyle='-.')
+    # Prices, MA and EMA are drawn as a single collection per subplot
+    x = mdates.date2num(data.index)
+    names = ['Prices', 'MA', 'EMA']
+    colors = ['blue', 'orange', 'green']
+    linestyles = ['-', '--', '-.']
+    linewidths = [0.7, 1.5, 1.5]
+    handles = [Line2D([], [], color=c, linestyle=ls, linewidth=lw)
+               for c, ls, lw in zip(colors, linestyles, linewidths)]
+
+    cols = list(data.columns)
+    prices = data.to_numpy(dtype=np.float64)
+    ma_arr = ma.reindex(index=data.index, columns=cols).to_numpy(dtype=np.float64)
+    ema_arr = ema.reindex(index=data.index, columns=cols).to_numpy(dtype=np.float64)
+
+    for i, ticker in enumerate(cols):
+        segments = np.stack([
+            np.column_stack([x, prices[:, i]]),
+            np.column_stack([x, ma_arr[:, i]]),
+            np.column_stack([x, ema_arr[:, i]]),
+        ])
+        axes[i].add_collection(LineCollection(segments, colors=colors,
+                                              linestyles=linestyles,
+                                              linewidths=linewidths))
+        axes[i].xaxis_date()
+        axes[i].autoscale_view()
         axes[i].set_title(f'{ticker} - Moving Averages')
-        axes[i].legend()
+        axes[i].legend(handles, [f'{ticker} - {name}' for name in names])
         axes[i].grid()
 
     plt.tight_layout()